@@ -9,128 +9,575 @@ report dangling links. Prints a readable table and optionally JSON.
 Usage:
     python3 symlink_resolver.py /path/to/scan
     python3 symlink_resolver.py /path/to/scan --json
+    python3 symlink_resolver.py /path/to/scan --verbose
+    python3 symlink_resolver.py /path/to/scan --jsonl links.jsonl
 """
 
 from __future__ import annotations
 import os
+import shutil
+import stat
+import subprocess
 import sys
+import threading
 import argparse
+import errno
 import json
-from typing import List, Tuple, Dict
+from collections import OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import List, Tuple, Dict, Iterator, Iterable, Optional, BinaryIO, Sequence
+
+try:
+    import orjson  # optional: faster --json output
+except ImportError:
+    orjson = None
 
 MAX_FOLLOW = 200  # safety cap for link following
+# Result statuses. A closed set, interned so every result shares one object
+# per status and comparisons can short-circuit on identity.
+OK = sys.intern("ok")
+BROKEN = sys.intern("broken")
+LOOP = sys.intern("loop")
+MAXDEPTH = sys.intern("maxdepth")
+ERROR = sys.intern("error")
+
+# shared chain value for results resolved without collect_chain
+_NO_CHAIN: Tuple[str, ...] = ()
+
+# "/" is the only separator, so an absolute target with no "//", "/." or
+# trailing "/" is already what normpath would return
+_POSIX_PATHS = os.sep == "/" and os.altsep is None
+
+# readlink() errors on the starting path that mean "not a symlink"
+_NOT_A_LINK = (errno.EINVAL, errno.ENOENT, errno.ENOTDIR)
+DEFAULT_WORKERS = 8  # resolver threads used by scan_tree
+SCAN_BATCH = 64  # links handed to a resolver thread per task
+CACHE_SIZE = 8192  # links remembered by scan_tree's resolution cache
+
+# Directory-fd relative walking (what os.fwalk relies on) is only available on
+# platforms where scandir accepts an fd and open accepts dir_fd.
+_HAVE_FD_SCAN = (os.scandir in os.supports_fd and os.open in os.supports_dir_fd
+                 and os.readlink in os.supports_dir_fd)
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# find(1) lists a tree's symlinks without a Python callback per entry. Only
+# the POSIX one will do (Windows ships an unrelated find.exe).
+_FIND = shutil.which("find") if os.name == "posix" else None
 
-def resolve_symlink(start_path: str, max_follow: int = MAX_FOLLOW) -> Dict:
+@dataclass(slots=True)
+class LinkResult:
+    """
+    Outcome of resolving one symlink. A slotted class instead of a dict keeps
+    per-record memory small on scans with millions of links.
+
+    status is one of OK | BROKEN | LOOP | MAXDEPTH | ERROR.
+    """
+    link: str  # absolute path to the symlink
+    status: str
+    resolved: Optional[str]  # final absolute target if available, or last attempted
+    chain: Sequence[str]  # intermediate absolute paths followed, if collected
+    error: Optional[str] = None
+
+
+class _ResolveCache(OrderedDict):
+    """
+    Bounded LRU map of link path -> cached resolution, shared by the worker
+    threads of one scan. Once it holds `maxsize` links the least recently
+    used one is dropped, so a scan's memory does not grow with the number
+    of links it finds.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = super().get(key, default)
+            if value is not default:
+                self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+
+def resolve_symlink(start_path: str, max_follow: int = MAX_FOLLOW, collect_chain: bool = False,
+                    cache: Optional[Dict[str, Tuple]] = None, first_target: Optional[str] = None) -> LinkResult:
     """
     Attempt to resolve a symlink by following readlink targets.
 
-    Returns dict:
-      {
-        "link": <absolute path to symlink>,
-        "status": "ok" | "broken" | "loop" | "maxdepth",
-        "resolved": <final absolute target if available or last attempted>,
-        "chain": [list of intermediate absolute paths followed]
-      }
+    Loops are found with Brent's cycle detection over the (st_dev, st_ino)
+    of each link passed through: only one saved "tortoise" identity is kept,
+    so memory stays constant however long the chain is, and two spellings of
+    the same link (e.g. through a directory symlink) still count as a
+    revisit. The intermediate paths are only recorded when collect_chain is
+    set.
+
+    `cache` is an optional dict shared between calls of one scan (scan_tree
+    uses a bounded _ResolveCache). Every link passed through on the way to
+    an "ok" or "broken" result is stored in it, with the hops behind it
+    only when collect_chain is set, so a later chain that runs into one of
+    those links stops there instead of following the rest again, as long
+    as the total number of hops stays within max_follow. Nothing is
+    invalidated; the dict is meant to live for a single snapshot of the
+    tree.
+
+    `first_target` is the raw readlink() value of start_path when the caller
+    already has it (the scanner reads it while listing the directory). The
+    entry point is then trusted to be a link and is not read again.
+    Otherwise its first readlink() doubles as the "is it a link" check.
+
+    Returns a LinkResult with status OK | BROKEN | LOOP | MAXDEPTH. Its chain
+    is the shared empty tuple unless collect_chain is set.
     """
     link = os.path.abspath(start_path)
-    if not os.path.islink(link):
-        raise ValueError(f"{link} is not a symbolic link")
+    # Brent: the tortoise jumps to the current link every power-of-two hops;
+    # running into it again means we are going round a cycle. The entry
+    # point is never lstat'ed, so it starts at the first downstream link.
+    tortoise = None
 
-    visited = []
+    # hot-loop helpers bound to locals, skipping the global/attribute lookups
+    _readlink, _lstat, _S_ISLNK = os.readlink, os.lstat, stat.S_ISLNK
+    _isabs, _normpath, _join = os.path.isabs, os.path.normpath, os.path.join
+    _dirname, _basename = os.path.dirname, os.path.basename
+
+    # filling the cache needs the links passed through, even if the caller
+    # doesn't want the chain; the list only lives for this call
+    track = collect_chain or cache is not None
+    chain = [] if track else _NO_CHAIN
     current = link
-    for i in range(max_follow):
+    power = lam = 1
+    n_hops = 0
+    while n_hops < max_follow:
+        n_hops += 1
+        if cache is not None:
+            hit = cache.get(current)
+            # a hit only stands in for the rest of the walk if the hops it
+            # covers still fit under max_follow; otherwise keep walking so
+            # the cap applies exactly as it does without a cache
+            if (hit is not None and n_hops - 1 + hit[2] <= max_follow
+                    and (hit[3] is not None or not collect_chain)):
+                status, resolved, remaining, hops, start = hit
+                total = n_hops - 1 + remaining
+                n_links = len(chain)  # links before current; current is already cached
+                if collect_chain:
+                    chain.extend(hops[start:])
+                break
+        if first_target is not None:
+            target, first_target = first_target, None
+        else:
+            try:
+                target = _readlink(current)  # may be relative
+            except OSError as e:
+                # the entry point is only validated by this readlink: EINVAL
+                # means it exists but is not a link, ENOENT/ENOTDIR that it
+                # doesn't exist at all
+                if n_hops == 1 and e.errno in _NOT_A_LINK:
+                    raise ValueError(f"{link} is not a symbolic link") from None
+                # readlink failed unexpectedly
+                return LinkResult(link, BROKEN, current, chain if collect_chain else _NO_CHAIN, str(e))
+        # a link naming itself (ln -s c c, or its own absolute path) is a
+        # loop; catch it from the raw string before any normalization
+        if target == current or target == _basename(current):
+            if track:
+                chain.append(current)
+            return LinkResult(link, LOOP, current, chain if collect_chain else _NO_CHAIN)
+        # If target is relative, interpret relative to directory containing 'current'.
+        # current is always absolute, so normpath is enough (abspath would
+        # also query the cwd on every hop)
+        if not _isabs(target):
+            next_path = _normpath(_join(_dirname(current), target))
+        elif _POSIX_PATHS and "//" not in target and "/." not in target and target[-1:] != "/":
+            # absolute farms (Nix store, /etc/alternatives, ...) mostly hold
+            # targets that are already normal; use them as they are
+            next_path = target
+        else:
+            next_path = _normpath(target)
+
+        if track:
+            chain.append(next_path)
+
+        # one lstat tells both whether next_path exists and whether it is
+        # itself a symlink to keep following
         try:
-            target = os.readlink(current)  # may be relative
-        except OSError as e:
-            # readlink failed unexpectedly
-            return {"link": link, "status": "broken", "resolved": current, "chain": visited, "error": str(e)}
-        # If target is relative, interpret relative to directory containing 'current'
-        if not os.path.isabs(target):
-            current_dir = os.path.dirname(current)
-            next_path = os.path.normpath(os.path.join(current_dir, target))
-            next_path = os.path.abspath(next_path)
+            st = _lstat(next_path)
+        except OSError:
+            # reached a target that doesn't exist -> dangling
+            status, resolved = BROKEN, next_path
         else:
-            next_path = os.path.abspath(target)
+            if _S_ISLNK(st.st_mode):
+                key = (st.st_dev, st.st_ino)
+                if key == tortoise:
+                    return LinkResult(link, LOOP, next_path, chain if collect_chain else _NO_CHAIN)
+                if lam == power:
+                    tortoise = key
+                    power *= 2
+                    lam = 0
+                lam += 1
+                current = next_path
+                continue
+            status, resolved = OK, next_path  # already absolute
+        total = n_hops
+        n_links = len(chain)  # link itself plus every hop but the final target
+        break
+    else:
+        # if we exit the loop, we exceeded max_follow. Brent may not have
+        # closed a long cycle yet, so check for one before calling it maxdepth
+        looped_at = _finish_brent(current, tortoise, power, lam, max_follow)
+        if looped_at is not None:
+            return LinkResult(link, LOOP, looped_at, chain if collect_chain else _NO_CHAIN)
+        return LinkResult(link, MAXDEPTH, current, chain if collect_chain else _NO_CHAIN)
 
-        visited.append(next_path)
+    if cache is not None:
+        # the i-th link of the chain resolves to the same place in
+        # total - i more hops, via hops[i:]; the hops themselves are only
+        # kept when chains are being collected
+        hops = tuple(chain) if collect_chain else None
+        cache[link] = (status, resolved, total, hops, 0)
+        for start in range(1, n_links):
+            cache[chain[start - 1]] = (status, resolved, total - start, hops, start)
+    return LinkResult(link, status, resolved, chain if collect_chain else _NO_CHAIN)
 
-        # loop detection: if we've seen this absolute path before -> loop
-        if next_path in visited[:-1]:
-            return {"link": link, "status": "loop", "resolved": next_path, "chain": visited}
 
-        # if next_path is itself a symlink, continue following it
-        if os.path.islink(next_path):
-            current = next_path
-            continue
+def _finish_brent(current: str, tortoise: Optional[Tuple[int, int]], power: int, lam: int,
+                  max_follow: int) -> Optional[str]:
+    """
+    Carry on resolve_symlink's Brent search past max_follow, for at most
+    another 2*max_follow hops, without recording anything. Brent only moves
+    its tortoise at power-of-two hops, so a cycle of ~max_follow/2 links or
+    more can still be open when the cap is hit. The tortoise is in the cycle
+    by the first power of two >= max(tail, cycle), i.e. before hop
+    2*max_follow, and is met again one lap later: any cycle the old
+    visited-list check found within max_follow hops closes by hop
+    3*max_follow. Returns the path where the cycle closed, or None if the
+    chain ends or the extra hops run out.
+    """
+    if tortoise is None:
+        return None
+    for _ in range(2 * max_follow):
+        try:
+            target = os.readlink(current)
+        except OSError:
+            return None
+        # join() drops the directory for absolute targets
+        next_path = os.path.normpath(os.path.join(os.path.dirname(current), target))
+        try:
+            st = os.lstat(next_path)
+        except OSError:
+            return None
+        if not stat.S_ISLNK(st.st_mode):
+            return None
+        key = (st.st_dev, st.st_ino)
+        if key == tortoise:
+            return next_path
+        if lam == power:
+            tortoise = key
+            power *= 2
+            lam = 0
+        lam += 1
+        current = next_path
+    return None
 
-        # not a symlink anymore. Check whether the file/dir exists
-        if os.path.exists(next_path):
-            return {"link": link, "status": "ok", "resolved": os.path.abspath(next_path), "chain": visited}
-        else:
-            # reached a non-symlink target that doesn't exist -> dangling
-            return {"link": link, "status": "broken", "resolved": next_path, "chain": visited}
 
-    # if we exit the loop, we exceeded max_follow
-    return {"link": link, "status": "maxdepth", "resolved": current, "chain": visited}
+def _resolve_or_error(path: str, collect_chain: bool = False, cache: Optional[Dict[str, Tuple]] = None,
+                      first_target: Optional[str] = None) -> LinkResult:
+    """
+    resolve_symlink wrapper for the scanner: failures become "error" records
+    instead of aborting the whole scan.
+    """
+    try:
+        return resolve_symlink(path, collect_chain=collect_chain, cache=cache, first_target=first_target)
+    except Exception as e:
+        return LinkResult(os.path.abspath(path), ERROR, None, _NO_CHAIN, str(e))
 
 
-def scan_tree(path: str, follow_dirs: bool = False) -> List[Dict]:
+def _resolve_batch(batch: List[Tuple[str, Optional[str]]], collect_chain: bool,
+                   cache: Optional[Dict[str, Tuple]]) -> List[LinkResult]:
     """
-    Recursively walk `path` and find symlinks. For each symlink found,
-    call resolve_symlink and collect results.
+    Resolve a batch of (path, raw target) pairs from the walker in one
+    thread-pool task, so each link doesn't pay for its own future.
+    """
+    return [_resolve_or_error(link, collect_chain, cache, raw) for link, raw in batch]
 
-    follow_dirs controls whether os.walk follows directory symlinks while scanning.
-    We do not follow directory symlinks by default to avoid scanning arbitrary other
-    parts of the filesystem.
+
+def _scan(path: str, follow_dirs: bool) -> Iterator[Tuple[str, Optional[str]]]:
     """
-    results = []
-    # Use os.walk but avoid following dir-links unless user specifically requested it
-    for root, dirs, files in os.walk(path, followlinks=follow_dirs):
-        # examine entries in this directory using lstat to detect symlinks without following
-        entries = files + dirs
-        for name in entries:
-            full = os.path.join(root, name)
+    Recursive os.scandir walk used by scan_tree; yields (path, raw target)
+    for every symlink found. The target is None if readlink failed.
+
+    DirEntry.is_symlink() / is_dir() answer from the d_type returned by the
+    directory listing, so most entries cost no extra stat call.
+    """
+    try:
+        it = os.scandir(path)
+    except OSError:
+        # unreadable directory: skip it, like os.walk does by default
+        return
+    _readlink = os.readlink
+    with it:
+        for entry in it:
             try:
-                st = os.lstat(full)
+                if entry.is_symlink():
+                    try:
+                        raw = _readlink(entry.path)
+                    except OSError:
+                        raw = None  # resolve_symlink will report it
+                    yield entry.path, raw
+                    # only descend through a directory symlink if asked to
+                    if follow_dirs and entry.is_dir():
+                        yield from _scan(entry.path, follow_dirs)
+                elif entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry.path, follow_dirs)
             except OSError:
                 continue
-            if os.path.islink(full):
+
+
+def _scan_fd(dir_fd: int, dirpath: str, follow_dirs: bool,
+             ancestors: Optional[set] = None) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Same walk as _scan, but every lookup is relative to an open directory fd
+    (the os.fwalk approach), so the kernel never re-resolves the full path of
+    deep entries. Full string paths are only built for symlinks and
+    subdirectories.
+
+    With follow_dirs, `ancestors` holds the (st_dev, st_ino) of every
+    directory on the current descent path, and a directory already in it
+    is not entered again (as find -L does). fd-relative paths never grow
+    too long, so nothing else would stop a link to an ancestor.
+    """
+    _readlink, _join = os.readlink, os.path.join
+    with os.scandir(dir_fd) as it:
+        for entry in it:
+            name = entry.name
+            try:
+                if entry.is_symlink():
+                    try:
+                        raw = _readlink(name, dir_fd=dir_fd)
+                    except OSError:
+                        raw = None  # resolve_symlink will report it
+                    yield _join(dirpath, name), raw
+                    if not (follow_dirs and entry.is_dir()):
+                        continue
+                    flags = _DIR_FLAGS
+                elif entry.is_dir(follow_symlinks=False):
+                    # O_NOFOLLOW guards against the entry being swapped for a link
+                    flags = _DIR_FLAGS | getattr(os, "O_NOFOLLOW", 0)
+                else:
+                    continue
+                sub_fd = os.open(name, flags, dir_fd=dir_fd)
+            except OSError:
+                continue
+            try:
+                if ancestors is None:
+                    yield from _scan_fd(sub_fd, _join(dirpath, name), follow_dirs)
+                    continue
+                st = os.fstat(sub_fd)
+                key = (st.st_dev, st.st_ino)
+                if key in ancestors:
+                    continue  # directory cycle
+                ancestors.add(key)
                 try:
-                    res = resolve_symlink(full)
-                except Exception as e:
-                    res = {"link": os.path.abspath(full), "status": "error", "error": str(e), "resolved": None, "chain": []}
-                results.append(res)
-    return results
+                    yield from _scan_fd(sub_fd, _join(dirpath, name), follow_dirs, ancestors)
+                finally:
+                    ancestors.discard(key)
+            except OSError:
+                pass
+            finally:
+                os.close(sub_fd)
+
+
+def _find_symlinks(path: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    List the symlinks under `path` with `find -H <path> -type l -print0`.
+    -H follows `path` itself if it is a link but nothing below it, like
+    the Python walkers without follow_dirs. The raw targets are not known
+    here, so they are yielded as None.
+    """
+    proc = subprocess.Popen([_FIND, "-H", path, "-type", "l", "-print0"],
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        rest = b""
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            names = (rest + chunk).split(b"\0")
+            rest = names.pop()
+            for name in names:
+                yield os.fsdecode(name), None
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+
+def _walk_symlinks(path: str, follow_dirs: bool) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Yield (path, raw target) for every symlink under `path`. find(1) does
+    the walk when it is available and directory links are not followed
+    (with -L, find's -type l would only match dangling links); otherwise
+    the fd-relative walker is used where the platform supports it.
+    """
+    if _FIND is not None and not follow_dirs:
+        try:
+            yield from _find_symlinks(path)
+            return
+        except OSError:
+            pass  # find could not be started
+    if not _HAVE_FD_SCAN:
+        yield from _scan(path, follow_dirs)
+        return
+    try:
+        top_fd = os.open(path, _DIR_FLAGS)
+    except OSError:
+        return
+    try:
+        ancestors = None
+        if follow_dirs:
+            st = os.fstat(top_fd)
+            ancestors = {(st.st_dev, st.st_ino)}
+        yield from _scan_fd(top_fd, path, follow_dirs, ancestors)
+    except OSError:
+        pass
+    finally:
+        os.close(top_fd)
+
+
+def scan_tree(path: str, follow_dirs: bool = False, workers: int = DEFAULT_WORKERS,
+              collect_chain: bool = False) -> Iterator[LinkResult]:
+    """
+    Recursively walk `path` and find symlinks. For each symlink found,
+    call resolve_symlink and yield its result as soon as it is ready, so
+    callers can stream results without holding the whole scan in memory.
+
+    follow_dirs controls whether directory symlinks are descended into while scanning.
+    We do not follow directory symlinks by default to avoid scanning arbitrary other
+    parts of the filesystem.
 
+    collect_chain is passed on to resolve_symlink. One bounded resolution
+    cache is shared by every link of the scan, so links that lead into the
+    same chain (node_modules, /lib64 -> /lib, ...) usually follow it once.
 
-def format_table(results: List[Dict]) -> str:
+    The walk itself is single-threaded; with workers > 1 the symlinks it finds
+    are resolved on a thread pool (readlink/stat release the GIL), which hides
+    latency on network filesystems. Links are submitted in batches of
+    SCAN_BATCH to keep the per-task overhead negligible on local disks.
+    Results keep the order the walk found them; at most a few batches per
+    worker are in flight at any time.
+    """
+    # make the root absolute once, so every path the walk yields is already
+    # absolute and resolve_symlink never has to look up the cwd
+    links = _walk_symlinks(os.path.abspath(path), follow_dirs)
+    cache = _ResolveCache()
+    if workers <= 1:
+        for link, raw in links:
+            yield _resolve_or_error(link, collect_chain, cache, raw)
+        return
+    window = workers * 2
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            batch = list(islice(links, SCAN_BATCH))
+            if not batch:
+                break
+            pending.append(pool.submit(_resolve_batch, batch, collect_chain, cache))
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# format_table pads columns with str.ljust rather than f-string alignment,
+# which would parse the format spec again for every row
+_TABLE_HEADER = "SYMLINK".ljust(60) + "  " + "STATUS".ljust(8) + "  " + "RESOLVED (final)".ljust(60)
+_TABLE_SEP = "-" * (len(_TABLE_HEADER) + 10)
+_CHAIN_PREFIX = "    -> "
+
+
+def format_table(results: Iterable[LinkResult]) -> str:
     """
     Produce a simple aligned text table of results.
     """
-    lines = []
-    header = f"{'SYMLINK':<60}  {'STATUS':<8}  {'RESOLVED (final)':<60}"
-    sep = "-" * (len(header) + 10)
-    lines.append(header)
-    lines.append(sep)
+    lines = [_TABLE_HEADER, _TABLE_SEP]
+    append = lines.append
     for r in results:
-        link = r.get("link", "")
-        status = r.get("status", "")
-        resolved = r.get("resolved", "") or ""
-        lines.append(f"{link:<60}  {status:<8}  {resolved:<60}")
+        link, status, resolved = r.link, r.status, r.resolved or ""
+        append(link.ljust(60) + "  " + status.ljust(8) + "  " + resolved.ljust(60))
         # add chain detail indented
-        chain = r.get("chain", [])
+        chain = r.chain
         if chain:
-            for c in chain:
-                lines.append(f"{'':4}-> {c}")
+            lines.extend(_CHAIN_PREFIX + c for c in chain)
     return "\n".join(lines)
 
 
+def _stdlib_dumps(r: LinkResult) -> bytes:
+    return json.dumps(asdict(r)).encode()
+
+
+def _json_dumps():
+    """Return a LinkResult -> JSON bytes serializer, orjson if available."""
+    if orjson is None:
+        return _stdlib_dumps
+
+    def dumps(r: LinkResult) -> bytes:
+        try:
+            return orjson.dumps(r)
+        except orjson.JSONEncodeError:
+            # orjson refuses the surrogate escapes os.fsdecode() uses for
+            # file names that aren't valid UTF-8; json writes them as \udcXX
+            return _stdlib_dumps(r)
+    return dumps
+
+
+def write_json(results: Iterable[LinkResult], out: BinaryIO) -> None:
+    """
+    Write results to the binary stream `out` as a JSON array, one record
+    per line, serializing each record as it arrives instead of the whole
+    list at once. Uses orjson (which serializes dataclasses natively) when
+    it is installed.
+    """
+    dumps = _json_dumps()
+    out.write(b"[")
+    sep = b"\n"
+    for r in results:
+        out.write(sep)
+        out.write(dumps(r))
+        sep = b",\n"
+    out.write(b"\n]\n")
+
+
+def write_jsonl(results: Iterable[LinkResult], out: BinaryIO) -> None:
+    """
+    Write results to the binary stream `out` as JSON Lines, one record per
+    line as it arrives. Records are not kept once written, and scan_tree's
+    resolution cache is capped at CACHE_SIZE links, so memory stays bounded
+    however many links the scan finds. The output can be fed to jq while
+    the scan is still running.
+    """
+    dumps = _json_dumps()
+    for r in results:
+        out.write(dumps(r) + b"\n")
+
+
 def main():
     p = argparse.ArgumentParser(description="Symbolic Link Path Resolver & Validator")
     p.add_argument("path", nargs="?", default=".", help="Path to scan (file or directory).")
-    p.add_argument("--json", action="store_true", help="Output results as JSON.")
-    p.add_argument("--follow-dirs", action="store_true", help="Let os.walk follow directory symlinks while scanning.")
+    output = p.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Output results as JSON.")
+    output.add_argument("--jsonl", metavar="OUT", help="Write results as JSON Lines to file OUT ('-' for stdout) instead.")
+    p.add_argument("--follow-dirs", action="store_true", help="Follow directory symlinks while scanning.")
+    p.add_argument("--parallel", type=int, default=DEFAULT_WORKERS, metavar="N",
+                   help=f"Resolve symlinks on N threads (default {DEFAULT_WORKERS}; 1 disables threading).")
+    p.add_argument("-v", "--verbose", action="store_true", help="Show the chain of paths followed for each symlink.")
     args = p.parse_args()
+    # chains are only collected when they will be shown; JSON always carries them
+    collect_chain = args.verbose or args.json or args.jsonl is not None
 
     target = args.path
     if not os.path.exists(target) and not os.path.islink(target):
@@ -138,20 +585,26 @@ def main():
         sys.exit(2)
 
     # If target is a file path and that file is a symlink, just resolve that; otherwise scan tree
-    results = []
     if os.path.islink(target) and not os.path.isdir(target):
-        try:
-            results = [resolve_symlink(target)]
-        except Exception as e:
-            results = [{"link": os.path.abspath(target), "status": "error", "error": str(e), "resolved": None, "chain": []}]
+        results = [_resolve_or_error(target, collect_chain=collect_chain)]
     else:
         # scan recursively
-        results = scan_tree(target, follow_dirs=args.follow_dirs)
+        results = scan_tree(target, follow_dirs=args.follow_dirs, workers=args.parallel,
+                            collect_chain=collect_chain)
 
-    if args.json:
-        print(json.dumps(results, indent=2))
+    if args.jsonl == "-":
+        sys.stdout.flush()
+        write_jsonl(results, sys.stdout.buffer)
+    elif args.jsonl is not None:
+        with open(args.jsonl, "wb") as out:
+            write_jsonl(results, out)
+    elif args.json:
+        # stream records straight to stdout as the scan produces them
+        sys.stdout.flush()
+        write_json(results, sys.stdout.buffer)
     else:
-        print(format_table(results))
+        # hand the whole table to stdout in one write
+        sys.stdout.write(format_table(results) + "\n")
 
 if __name__ == "__main__":
     main()
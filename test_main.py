@@ -0,0 +1,68 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import main
+
+
+class ScanTreeTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+
+    def test_follow_dirs_stops_at_link_to_ancestor(self):
+        os.mkdir(os.path.join(self.root, "sub"))
+        os.symlink("..", os.path.join(self.root, "sub", "up"))
+        results = list(main.scan_tree(self.root, follow_dirs=True, workers=1))
+        up = os.path.join(self.root, "sub", "up")
+        self.assertIn(up, [r.link for r in results])
+        self.assertTrue(all(r.status == main.OK for r in results))
+
+    def test_cache_keeps_max_follow(self):
+        open(os.path.join(self.root, "final"), "w").close()
+        prev = "final"
+        for i in range(main.MAX_FOLLOW + 51):
+            os.symlink(prev, os.path.join(self.root, f"l{i}"))
+            prev = f"l{i}"
+        for workers in (1, 8):
+            statuses = [r.status for r in main.scan_tree(self.root, workers=workers)]
+            self.assertEqual(statuses.count(main.OK), main.MAX_FOLLOW)
+            self.assertEqual(statuses.count(main.MAXDEPTH), 51)
+
+    def test_json_output_with_non_utf8_name(self):
+        os.symlink(b"target", os.path.join(os.fsencode(self.root), b"bad\xffname"))
+        out = io.BytesIO()
+        main.write_json(main.scan_tree(self.root, workers=1), out)
+        records = json.loads(out.getvalue())
+        self.assertEqual(records[0]["link"], os.path.join(self.root, "bad\udcffname"))
+
+
+class ResolveSymlinkTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+
+    def test_long_cycle_is_loop(self):
+        n = 150
+        for i in range(n):
+            os.symlink(f"l{(i + 1) % n}", os.path.join(self.root, f"l{i}"))
+        result = main.resolve_symlink(os.path.join(self.root, "l0"))
+        self.assertEqual(result.status, main.LOOP)
+
+
+class ResolveCacheTest(unittest.TestCase):
+    def test_drops_least_recently_used(self):
+        cache = main._ResolveCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        self.assertEqual(list(cache), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()